@@ -43,6 +43,13 @@ class Laser:
         Only used if ``dim`` is ``'rt'``. The number of azimuthal modes
         used in order to represent the laser field.
 
+    precision : string (optional)
+        Floating-point precision in which the envelope is stored.
+        Options: ``'double'`` (``complex128``, default) and ``'single'``
+        (``complex64``). Single precision halves the memory used by the
+        envelope, at the cost of a lower accuracy. In both cases, the
+        profile is evaluated in double precision.
+
     Examples
     --------
 
@@ -91,27 +98,35 @@ class Laser:
     >>>         axes[step].set(ylabel='r (µm)')
     """
 
-    def __init__(self, dim, lo, hi, npoints, profile, n_azimuthal_modes=1):
+    def __init__(
+        self, dim, lo, hi, npoints, profile, n_azimuthal_modes=1, precision="double"
+    ):
+        if precision == "double":
+            dtype = "complex128"
+        elif precision == "single":
+            dtype = "complex64"
+        else:
+            raise ValueError(f'precision "{precision}" not recognized')
         box = Box(dim, lo, hi, npoints, n_azimuthal_modes)
         self.box = box
-        self.field = Grid(dim, self.box)
+        self.field = Grid(dim, self.box, dtype)
         self.dim = dim
         self.profile = profile
 
         # Create the grid on which to evaluate the laser, evaluate it
         if self.dim == "xyt":
-            x, y, t = np.meshgrid(*box.axes, indexing="ij")
-            self.field.field[...] = profile.evaluate(x, y, t)
+            x, y, t = np.meshgrid(*box.axes, indexing="ij", sparse=True)
+            self.field.field[...] = profile.evaluate_broadcast(x, y, t)
         elif self.dim == "rt":
             # Generate 2*n_azimuthal_modes - 1 evenly-spaced values of
             # theta, to evaluate the laser
             n_theta = 2 * box.n_azimuthal_modes - 1
             theta1d = 2 * np.pi / n_theta * np.arange(n_theta)
-            theta, r, t = np.meshgrid(theta1d, *box.axes, indexing="ij")
+            theta, r, t = np.meshgrid(theta1d, *box.axes, indexing="ij", sparse=True)
             x = r * np.cos(theta)
             y = r * np.sin(theta)
             # Evaluate the profile on the generated grid
-            envelope = profile.evaluate(x, y, t)
+            envelope = profile.evaluate_broadcast(x, y, t)
             # Perform the azimuthal decomposition
             self.field.field[...] = np.fft.ifft(envelope, axis=0)
 
@@ -205,8 +220,11 @@ class Laser:
                         )
                     )
             # Propagate the spectral image
+            # (the propagators of axiprop operate in double precision)
             for i_m in range(self.box.azimuthal_modes.size):
-                transform_data = np.transpose(self.field.field_fft[i_m]).copy()
+                transform_data = np.transpose(self.field.field_fft[i_m]).astype(
+                    "complex128", order="C"
+                )
                 self.prop[i_m].step(transform_data, distance, overwrite=True)
                 self.field.field_fft[i_m, :, :] = np.transpose(transform_data).copy()
         else:
@@ -225,7 +243,10 @@ class Laser:
                     verbose=False,
                 )
             # Propagate the spectral image
-            transform_data = np.transpose(self.field.field_fft).copy()
+            # (the propagators of axiprop operate in double precision)
+            transform_data = np.transpose(self.field.field_fft).astype(
+                "complex128", order="C"
+            )
             self.prop.step(transform_data, distance, overwrite=True)
             self.field.field_fft[:, :, :] = np.transpose(transform_data).copy()
 
@@ -244,10 +265,10 @@ class Laser:
         # Transform field from frequency to temporal domain
         self.field.field = np.fft.ifft(
             self.field.field_fft, axis=time_axis_indx, norm="forward"
-        )
+        ).astype(self.field.dtype, copy=False)
 
         # Translate phase of the retrieved envelope by the distance
-        self.field.field *= np.exp(1j * self.profile.omega0 * distance / scc.c)
+        self.field.field *= np.exp(1j * self.profile.k0 * distance)
 
     def write_to_file(self, file_prefix="laser", file_format="h5"):
         """
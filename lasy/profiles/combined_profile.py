@@ -1,3 +1,5 @@
+import numpy as np
+
 from .profile import Profile
 
 
@@ -70,3 +72,32 @@ class CombinedLongitudinalTransverseProfile(Profile):
         """
         envelope = self.trans_profile.evaluate(x, y) * self.long_profile.evaluate(t)
         return envelope
+
+    def evaluate_broadcast(self, x, y, t):
+        """
+        Returns the envelope field of the laser, on points defined by arrays
+        that are only broadcastable to each other
+
+        Parameters
+        ----------
+        x, y, t: ndarrays of floats
+            Define points on which to evaluate the envelope
+            These arrays need to be broadcastable to a common shape.
+
+        Returns
+        -------
+        envelope: ndarray of complex numbers
+            Contains the value of the envelope at the specified points
+            This array has the broadcast shape of the arrays x, y, t
+        """
+        # Subclasses that override `evaluate` may rely on x, y, t having
+        # the same shape: evaluate them on the full broadcast grid
+        if type(self).evaluate is not CombinedLongitudinalTransverseProfile.evaluate:
+            return super().evaluate_broadcast(x, y, t)
+        # Otherwise, the transverse and longitudinal profiles are evaluated
+        # on the (x, y) and t arrays respectively, and only their product is
+        # computed on the full grid. Transverse profiles expect x and y
+        # of the same shape, so these are broadcast to each other first.
+        x, y = np.broadcast_arrays(x, y)
+        envelope = self.trans_profile.evaluate(x, y) * self.long_profile.evaluate(t)
+        return envelope
@@ -1,3 +1,5 @@
+import numbers
+
 import numpy as np
 import scipy.constants as scc
 
@@ -28,11 +30,16 @@ class Profile(object):
     """
 
     def __init__(self, wavelength, pol):
-        assert len(pol) == 2
+        if len(pol) != 2:
+            raise ValueError("The polarization vector must have 2 components.")
         norm_pol = np.sqrt(np.abs(pol[0]) ** 2 + np.abs(pol[1]) ** 2)
         self.pol = np.array([pol[0] / norm_pol, pol[1] / norm_pol])
-        self.lambda0 = wavelength
-        self.omega0 = 2 * scc.pi * scc.c / self.lambda0
+        self.lambda0 = float(wavelength)
+        # Central wavenumber and angular frequency
+        self.k0 = 2 * scc.pi / self.lambda0
+        self.omega0 = scc.c * self.k0
+        # The base class only defines dummy fields, which are zero everywhere
+        self._is_zero = type(self) is Profile
 
     def evaluate(self, x, y, t):
         """
@@ -53,3 +60,245 @@ class Profile(object):
         # The base class only defines dummy fields
         # (This should be replaced by any class that inherits from this one.)
         return np.zeros_like(x, dtype="complex128")
+
+    def evaluate_broadcast(self, x, y, t):
+        """
+        Returns the envelope field of the laser, on points defined by arrays
+        that are only broadcastable to each other (e.g. the output of
+        ``np.meshgrid(..., sparse=True)``)
+
+        Profiles whose expression is separable can override this method,
+        in order to evaluate each factor on the corresponding axes only,
+        instead of on the full grid. By default, the arrays are broadcast
+        to their common shape and passed to `evaluate`.
+
+        Parameters
+        ----------
+        x, y, t: ndarrays of floats
+            Define points on which to evaluate the envelope
+            These arrays need to be broadcastable to a common shape.
+
+        Returns
+        -------
+        envelope: ndarray of complex numbers
+            Contains the value of the envelope at the specified points
+            This array has the broadcast shape of the arrays x, y, t
+        """
+        return self.evaluate(*np.broadcast_arrays(x, y, t))
+
+    def __add__(self, other):
+        """
+        Return the sum of two profiles
+        """
+        return SummedProfile(self, other)
+
+    def __mul__(self, factor):
+        """
+        Return the profile multiplied by a scalar factor
+        """
+        return ScaledProfile(self, factor)
+
+    def __rmul__(self, factor):
+        """
+        Return the profile multiplied by a scalar factor
+        """
+        return ScaledProfile(self, factor)
+
+
+class SummedProfile(Profile):
+    """
+    Class for a profile that is the sum of several other profiles.
+
+    Parameters
+    ----------
+    profiles : list of Profile objects
+        List of profiles to be summed.
+    """
+
+    def __init__(self, *profiles):
+        if len(profiles) == 0:
+            raise ValueError("At least one profile must be given.")
+        # Check that all profiles are Profile objects
+        for p in profiles:
+            if not isinstance(p, Profile):
+                raise TypeError("Added profiles must be Profile objects.")
+        self.profiles = profiles
+        # Check that all profiles have the same wavelength and polarization
+        lambda0 = profiles[0].lambda0
+        pol = profiles[0].pol
+        for p in profiles[1:]:
+            if abs(p.lambda0 - lambda0) > 1e-8 * abs(lambda0):
+                raise ValueError("Added profiles must have the same wavelength.")
+            if np.max(np.abs(p.pol - pol)) > 1e-8:
+                raise ValueError("Added profiles must have the same polarization.")
+        # Initialize the parent class
+        super().__init__(lambda0, pol)
+        # Flatten nested sums and group their terms by profile identity, so
+        # that a profile appearing several times, e.g. in (A + B) + A,
+        # is only evaluated once
+        terms = {}
+        for p in profiles:
+            p_terms = p._terms if isinstance(p, SummedProfile) else [(p, 1)]
+            for term_profile, count in p_terms:
+                # Terms that are zero everywhere do not need to be evaluated
+                if term_profile._is_zero:
+                    continue
+                if id(term_profile) in terms:
+                    terms[id(term_profile)][1] += count
+                else:
+                    terms[id(term_profile)] = [term_profile, count]
+        self._terms = [tuple(term) for term in terms.values()]
+        self._is_zero = len(self._terms) == 0
+
+    def evaluate(self, x, y, t):
+        """
+        Returns the envelope field of the laser
+
+        Parameters
+        ----------
+        x, y, t: ndarrays of floats
+            Define points on which to evaluate the envelope
+            These arrays need to all have the same shape.
+
+        Returns
+        -------
+        envelope: ndarray of complex numbers
+            Contains the value of the envelope at the specified points
+            This array has the same shape as the arrays x, y, t
+        """
+        return self._sum_terms(lambda p: p.evaluate(x, y, t), x.shape)
+
+    def evaluate_broadcast(self, x, y, t):
+        """
+        Returns the envelope field of the laser, on points defined by arrays
+        that are only broadcastable to each other
+
+        Parameters
+        ----------
+        x, y, t: ndarrays of floats
+            Define points on which to evaluate the envelope
+            These arrays need to be broadcastable to a common shape.
+
+        Returns
+        -------
+        envelope: ndarray of complex numbers
+            Contains the value of the envelope at the specified points
+            This array has the broadcast shape of the arrays x, y, t
+        """
+        shape = np.broadcast_shapes(x.shape, y.shape, t.shape)
+        return self._sum_terms(lambda p: p.evaluate_broadcast(x, y, t), shape)
+
+    def _sum_terms(self, evaluate_term, shape):
+        """
+        Returns the sum of the envelopes of all terms, where the envelope
+        of each term is obtained by calling ``evaluate_term(profile)``,
+        and ``shape`` is the shape of the envelope
+        """
+        if self._is_zero:
+            return np.zeros(shape, dtype="complex128")
+        # Accumulate in place into the first envelope, so that only
+        # one full-size array is alive besides the one being added
+        envelope = None
+        for p, count in self._terms:
+            term = evaluate_term(p)
+            if count > 1:
+                term *= count
+            if envelope is None:
+                if term.shape == shape and np.iscomplexobj(term):
+                    envelope = term
+                else:
+                    # Terms may return an envelope that is only broadcastable
+                    # to the full shape, which cannot serve as accumulator
+                    envelope = np.broadcast_to(term, shape).astype("complex128")
+            else:
+                np.add(envelope, term, out=envelope)
+        return envelope
+
+
+class ScaledProfile(Profile):
+    """
+    Class for a profile that is another profile multiplied by a factor.
+
+    Parameters
+    ----------
+    profile : Profile object
+        Profile to be scaled.
+    factor : number (int, float or complex, including NumPy scalars)
+        Factor by which the profile is multiplied.
+    """
+
+    def __init__(self, profile, factor):
+        # Check that the factor is a number
+        if not isinstance(factor, numbers.Number):
+            raise TypeError("The scaling factor must be a number.")
+        # Check that the profile is a Profile object
+        if not isinstance(profile, Profile):
+            raise TypeError("The scaled profile must be a Profile object.")
+        self.profile = profile
+        self.factor = factor
+        # Initialize the parent class
+        super().__init__(profile.lambda0, profile.pol)
+        # Flag the trivial factors, for which evaluating the profile
+        # (for 0) or multiplying the envelope (for 1) can be skipped
+        self._is_zero = factor == 0 or profile._is_zero
+        self._is_one = factor == 1
+
+    def evaluate(self, x, y, t):
+        """
+        Returns the envelope field of the laser
+
+        Parameters
+        ----------
+        x, y, t: ndarrays of floats
+            Define points on which to evaluate the envelope
+            These arrays need to all have the same shape.
+
+        Returns
+        -------
+        envelope: ndarray of complex numbers
+            Contains the value of the envelope at the specified points
+            This array has the same shape as the arrays x, y, t
+        """
+        if self._is_zero:
+            return np.zeros(x.shape, dtype="complex128")
+        envelope = self.profile.evaluate(x, y, t)
+        if not self._is_one:
+            envelope = self._scale(envelope)
+        return envelope
+
+    def evaluate_broadcast(self, x, y, t):
+        """
+        Returns the envelope field of the laser, on points defined by arrays
+        that are only broadcastable to each other
+
+        Parameters
+        ----------
+        x, y, t: ndarrays of floats
+            Define points on which to evaluate the envelope
+            These arrays need to be broadcastable to a common shape.
+
+        Returns
+        -------
+        envelope: ndarray of complex numbers
+            Contains the value of the envelope at the specified points
+            This array has the broadcast shape of the arrays x, y, t
+        """
+        if self._is_zero:
+            shape = np.broadcast_shapes(x.shape, y.shape, t.shape)
+            return np.zeros(shape, dtype="complex128")
+        envelope = self.profile.evaluate_broadcast(x, y, t)
+        if not self._is_one:
+            envelope = self._scale(envelope)
+        return envelope
+
+    def _scale(self, envelope):
+        """
+        Returns the envelope multiplied by the factor, in place when the
+        result can be stored in the envelope array (e.g. not for a complex
+        factor and a real-valued envelope)
+        """
+        if np.can_cast(np.result_type(envelope, self.factor), envelope.dtype):
+            envelope *= self.factor
+        else:
+            envelope = envelope * self.factor
+        return envelope
@@ -61,8 +61,9 @@ class LaguerreGaussianTransverseProfile(TransverseProfile):
             complex_position = x - 1j * y
         else:
             complex_position = x + 1j * y
-        radius = abs(complex_position)
-        scaled_rad_squared = (radius**2) / self.w0**2
+        # r^2 is computed directly from x and y, rather than as
+        # abs(complex_position)**2, which would take a square root
+        scaled_rad_squared = (x**2 + y**2) / self.w0**2
         envelope = (
             complex_position ** abs(self.m)
             * genlaguerre(self.p, abs(self.m))(2 * scaled_rad_squared)
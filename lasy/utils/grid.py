@@ -17,16 +17,39 @@ class Grid:
 
     box : Box
         Object containing metadata for the grid array
+
+    dtype : string (optional)
+        Data type of the envelope array.
+        Options are ``'complex128'`` (default) and ``'complex64'``.
+
+    Attributes
+    ----------
+    keep_scratch : bool
+        Whether the peak normalizations (see
+        :func:`lasy.utils.laser_utils.compute_peak_field_amplitude`) keep a
+        real scratch array of the same shape as the envelope on the grid,
+        and reuse it in later calls. This avoids a full-size allocation for
+        repeated normalizations, at the cost of permanently holding half of
+        the memory of the envelope. ``False`` by default; the array can be
+        freed with :meth:`release_scratch`.
     """
 
-    def __init__(self, dim, box):
+    def __init__(self, dim, box, dtype="complex128"):
         self.box = box
+        self.dtype = dtype
+        self.keep_scratch = False
+        self._abs_scratch = None
         if dim == "xyt":
-            self.field = np.zeros(box.npoints, dtype="complex128")
+            self.field = np.zeros(box.npoints, dtype=dtype)
         elif dim == "rt":
             # Azimuthal modes are arranged in the following order:
             # 0, 1, 2, ..., n_azimuthal_modes-1, -n_azimuthal_modes+1, ..., -1
             ncomp = 2 * self.box.n_azimuthal_modes - 1
-            self.field = np.zeros(
-                (ncomp, box.npoints[0], box.npoints[1]), dtype="complex128"
-            )
+            self.field = np.zeros((ncomp, box.npoints[0], box.npoints[1]), dtype=dtype)
+
+    def release_scratch(self):
+        """
+        Free the scratch array used by the peak normalizations
+        (it is allocated again if needed)
+        """
+        self._abs_scratch = None
@@ -37,24 +37,79 @@ def compute_laser_energy(dim, grid):
 
     dz = box.dx[-1] * c
 
+    # Sum of |E_env|^2 along the time axis, for each transverse point.
+    # Viewing the complex envelope as interleaved (real, imag) floats lets
+    # this be computed in a single contiguous pass over the data, without
+    # any full-size temporary array. These partial sums are then accumulated
+    # in double precision, also when the envelope is stored in single precision.
+    envelope = np.ascontiguousarray(envelope)
+    envelope = envelope.view(envelope.real.dtype)
+    abs2 = np.einsum("...t,...t->...", envelope, envelope).astype(np.float64)
+
     if dim == "xyt":
         dV = box.dx[0] * box.dx[1] * dz
-        energy = ((dV * epsilon_0 * 0.5) * abs(envelope) ** 2).sum()
+        energy = (dV * epsilon_0 * 0.5) * abs2.sum()
     elif dim == "rt":
-        r = box.axes[0]
-        dr = box.dx[0]
         # 1D array that computes the volume of radial cells
-        dV = np.pi * ((r + 0.5 * dr) ** 2 - (r - 0.5 * dr) ** 2) * dz
-        energy = (
-            dV[np.newaxis, :, np.newaxis]
-            * epsilon_0
-            * 0.5
-            * abs(envelope[:, :, :]) ** 2
-        ).sum()
+        # (it only depends on the geometry of the box, and is thus cached)
+        dV = getattr(box, "_dV_rt", None)
+        if dV is None:
+            r = box.axes[0]
+            dr = box.dx[0]
+            dV = np.pi * ((r + 0.5 * dr) ** 2 - (r - 0.5 * dr) ** 2) * dz
+            box._dV_rt = dV
+        energy = epsilon_0 * 0.5 * np.dot(dV, abs2.sum(axis=0))
 
     return energy
 
 
+def scale_field(grid, factor):
+    """
+    Multiply the envelope contained in grid by a real factor, in place
+
+    Parameters
+    ----------
+    grid : a Grid object
+        Contains value of the laser envelope and metadata
+
+    factor : real scalar
+        Factor by which the envelope is multiplied
+    """
+    field = grid.field
+    if field.flags.c_contiguous:
+        # Multiplying the interleaved (real, imag) floats by a real factor
+        # avoids a full complex multiplication for each point
+        field = field.view(field.real.dtype)
+    field *= factor
+
+
+def compute_peak_field_amplitude(grid):
+    """
+    Computes the maximum of the modulus of the envelope contained in grid
+
+    Parameters
+    ----------
+    grid : a Grid object
+        Contains value of the laser envelope and metadata
+
+    Returns
+    -------
+    peak_field_amplitude : float (V/m)
+    """
+    # Unless the grid opts in to keeping a scratch array, |E_env| is
+    # a temporary array that is freed after the reduction
+    if not grid.keep_scratch:
+        grid.release_scratch()
+        return np.abs(grid.field).max()
+    # Otherwise, |E_env| is written into a scratch array kept on the grid,
+    # so that repeated normalizations do not allocate a new full-size array
+    scratch = grid._abs_scratch
+    if scratch is None or scratch.shape != grid.field.shape:
+        scratch = np.empty(grid.field.shape, dtype=grid.field.real.dtype)
+        grid._abs_scratch = scratch
+    return np.abs(grid.field, out=scratch).max()
+
+
 def normalize_energy(dim, energy, grid):
     """
     Normalize energy of the laser pulse contained in grid
@@ -81,7 +136,7 @@ def normalize_energy(dim, energy, grid):
 
     current_energy = compute_laser_energy(dim, grid)
     norm_factor = (energy / current_energy) ** 0.5
-    grid.field *= norm_factor
+    scale_field(grid, norm_factor)
 
 
 def normalize_peak_field_amplitude(amplitude, grid):
@@ -99,7 +154,9 @@ def normalize_peak_field_amplitude(amplitude, grid):
 
     if amplitude is None:
         return
-    grid.field = grid.field / np.abs(grid.field).max() * amplitude
+    input_peak_field_amplitude = compute_peak_field_amplitude(grid)
+
+    scale_field(grid, amplitude / input_peak_field_amplitude)
 
 
 def normalize_peak_intensity(peak_intensity, grid):
@@ -117,7 +174,9 @@ def normalize_peak_intensity(peak_intensity, grid):
 
     if peak_intensity is None:
         return
-    intensity = np.abs(epsilon_0 * grid.field**2 / 2 * c)
-    input_peak_intensity = intensity.max()
+    # Find the peak of |E_env| first, and convert only this scalar to an
+    # intensity, instead of computing the intensity on the whole grid
+    peak_field_amplitude = compute_peak_field_amplitude(grid)
+    input_peak_intensity = epsilon_0 * peak_field_amplitude**2 / 2 * c
 
-    grid.field *= np.sqrt(peak_intensity / input_peak_intensity)
+    scale_field(grid, np.sqrt(peak_intensity / input_peak_intensity))
@@ -1,3 +1,19 @@
 # -*- coding: utf-8 -*-
 
-# no pytest fixtures defined yet
+import pytest
+
+from lasy.profiles.gaussian_profile import GaussianProfile
+
+
+@pytest.fixture(scope="function")
+def gaussian():
+    # Cases with Gaussian laser
+    wavelength = 0.8e-6
+    pol = (1, 0)
+    laser_energy = 1.0  # J
+    t_peak = 0.0e-15  # s
+    tau = 30.0e-15  # s
+    w0 = 5.0e-6  # m
+    profile = GaussianProfile(wavelength, pol, laser_energy, w0, tau, t_peak)
+
+    return profile
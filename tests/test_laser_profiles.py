@@ -2,13 +2,16 @@
 
 import pytest
 
+import numpy as np
 from lasy.laser import Laser
 from lasy.profiles import CombinedLongitudinalTransverseProfile, GaussianProfile
 from lasy.profiles.longitudinal import GaussianLongitudinalProfile
+from lasy.profiles.profile import Profile, SummedProfile
 from lasy.profiles.transverse import (
     LaguerreGaussianTransverseProfile,
     SuperGaussianTransverseProfile,
 )
+from lasy.profiles.transverse.transverse_profile import TransverseProfile
 
 
 @pytest.fixture(scope="function")
@@ -107,3 +110,230 @@ def test_profile_super_gauss():
     laser.write_to_file("superGaussianlaserRZ")
 
     return profile
+
+
+class RealProfile(Profile):
+    # Profile whose envelope is real-valued
+    def evaluate(self, x, y, t):
+        return np.exp(-((t / 30e-15) ** 2)) * np.ones_like(x)
+
+
+def test_add_profiles(gaussian):
+    # Add the two Gaussian profiles together
+    wavelength = gaussian.lambda0
+    pol = (1, 0)
+    laser_energy = gaussian.laser_energy
+    t_peak = gaussian.long_profile.t_peak
+    tau = gaussian.long_profile.tau
+    w0 = gaussian.trans_profile.w0
+    profile_1 = gaussian
+    profile_2 = GaussianProfile(wavelength, pol, laser_energy, 2 * w0, tau, t_peak)
+    summed_profile = profile_1 + profile_2
+    scaled_profile = 2 * profile_1
+
+    x, y, t = np.meshgrid(
+        np.linspace(-10e-6, 10e-6, 20),
+        np.linspace(-10e-6, 10e-6, 20),
+        np.linspace(-60e-15, 60e-15, 20),
+        indexing="ij",
+    )
+    envelope_1 = profile_1.evaluate(x, y, t)
+    envelope_2 = profile_2.evaluate(x, y, t)
+    assert np.allclose(summed_profile.evaluate(x, y, t), envelope_1 + envelope_2)
+    assert np.allclose(scaled_profile.evaluate(x, y, t), 2 * envelope_1)
+    assert np.allclose((profile_1 * np.int64(2)).evaluate(x, y, t), 2 * envelope_1)
+    assert np.allclose(
+        (profile_1 * np.float32(0.5)).evaluate(x, y, t), 0.5 * envelope_1
+    )
+    # Check that complex factors can be applied to real-valued profiles
+    real_profile = RealProfile(wavelength, pol)
+    real_envelope = real_profile.evaluate(x, y, t)
+    assert np.allclose((1j * real_profile).evaluate(x, y, t), 1j * real_envelope)
+    assert np.allclose(
+        (profile_1 + 1j * real_profile).evaluate(x, y, t),
+        envelope_1 + 1j * real_envelope,
+    )
+    assert np.allclose(
+        (1j * real_profile + profile_1).evaluate(x, y, t),
+        envelope_1 + 1j * real_envelope,
+    )
+    xs, ys, ts = np.meshgrid(
+        x[:, 0, 0], y[0, :, 0], t[0, 0, :], indexing="ij", sparse=True
+    )
+    assert np.allclose(
+        (1j * real_profile + profile_1).evaluate_broadcast(xs, ys, ts),
+        envelope_1 + 1j * real_envelope,
+    )
+
+    # Check that a profile appearing several times in a sum is grouped
+    resummed_profile = summed_profile + profile_1
+    assert len(resummed_profile._terms) == 2
+    assert np.allclose(resummed_profile.evaluate(x, y, t), 2 * envelope_1 + envelope_2)
+
+    # Check that incompatible profiles cannot be added
+    profile_3 = GaussianProfile(2 * wavelength, pol, laser_energy, w0, tau, t_peak)
+    profile_4 = GaussianProfile(wavelength, (0, 1), laser_energy, w0, tau, t_peak)
+    with pytest.raises(ValueError):
+        profile_1 + profile_3
+    with pytest.raises(ValueError):
+        profile_1 + profile_4
+    with pytest.raises(TypeError):
+        profile_1 * "2"
+    with pytest.raises(ValueError):
+        SummedProfile()
+
+    # Check that the profiles can be used to create a laser
+    laser = Laser("rt", (0e-6, -60e-15), (10e-6, +60e-15), (50, 100), summed_profile)
+    laser.normalize(laser_energy, kind="energy")
+
+
+class TemporalProfile(Profile):
+    # Profile that only depends on t, and whose evaluate_broadcast
+    # returns an envelope with the shape of t only
+    def evaluate(self, x, y, t):
+        return np.exp(-((t / 30e-15) ** 2)) * np.ones_like(x, dtype="complex128")
+
+    def evaluate_broadcast(self, x, y, t):
+        return np.exp(-((t / 30e-15) ** 2)).astype("complex128")
+
+
+class FailingProfile(Profile):
+    # Profile that must not be evaluated
+    def evaluate(self, x, y, t):
+        raise RuntimeError("This profile should not be evaluated.")
+
+    def evaluate_broadcast(self, x, y, t):
+        raise RuntimeError("This profile should not be evaluated.")
+
+
+def test_trivial_scaling(gaussian):
+    # Check the shortcuts for factors 0 and 1
+    axes = (
+        np.linspace(-10e-6, 10e-6, 20),
+        np.linspace(-10e-6, 10e-6, 30),
+        np.linspace(-60e-15, 60e-15, 40),
+    )
+    x, y, t = np.meshgrid(*axes, indexing="ij")
+    xs, ys, ts = np.meshgrid(*axes, indexing="ij", sparse=True)
+    envelope = gaussian.evaluate(x, y, t)
+
+    assert np.all((0 * gaussian).evaluate(x, y, t) == 0)
+    assert np.allclose((1 * gaussian).evaluate(x, y, t), envelope)
+    assert np.allclose((1 * gaussian).evaluate_broadcast(xs, ys, ts), envelope)
+
+    # The profile should not be evaluated for a factor 0
+    zero_profile = 0 * FailingProfile(0.8e-6, (1, 0))
+    assert np.all(zero_profile.evaluate(x, y, t) == 0)
+    assert np.all(zero_profile.evaluate_broadcast(xs, ys, ts) == 0)
+    assert zero_profile.evaluate_broadcast(xs, ys, ts).shape == x.shape
+
+
+def test_zero_terms(gaussian):
+    # Check that terms that are zero everywhere are dropped from sums
+    axes = (
+        np.linspace(-10e-6, 10e-6, 20),
+        np.linspace(-10e-6, 10e-6, 30),
+        np.linspace(-60e-15, 60e-15, 40),
+    )
+    x, y, t = np.meshgrid(*axes, indexing="ij")
+    xs, ys, ts = np.meshgrid(*axes, indexing="ij", sparse=True)
+    envelope = gaussian.evaluate(x, y, t)
+
+    dummy_profile = Profile(0.8e-6, (1, 0))
+    summed_profile = gaussian + dummy_profile
+    assert summed_profile._terms == [(gaussian, 1)]
+    assert np.allclose(summed_profile.evaluate(x, y, t), envelope)
+    assert np.allclose(summed_profile.evaluate_broadcast(xs, ys, ts), envelope)
+
+    zero_profile = 0 * gaussian + dummy_profile
+    assert zero_profile._terms == []
+    assert np.all(zero_profile.evaluate(x, y, t) == 0)
+    assert np.all(zero_profile.evaluate_broadcast(xs, ys, ts) == 0)
+
+
+def test_evaluate_broadcast(gaussian):
+    # Check that evaluating on sparse grids gives the same envelope
+    axes = (
+        np.linspace(-10e-6, 10e-6, 20),
+        np.linspace(-10e-6, 10e-6, 30),
+        np.linspace(-60e-15, 60e-15, 40),
+    )
+    x, y, t = np.meshgrid(*axes, indexing="ij")
+    xs, ys, ts = np.meshgrid(*axes, indexing="ij", sparse=True)
+    for profile in [
+        gaussian,
+        gaussian + 0.5 * gaussian,
+        0 * gaussian,
+        1 * gaussian,
+        Profile(0.8e-6, (1, 0)),
+        gaussian + Profile(0.8e-6, (1, 0)),
+        0 * gaussian + Profile(0.8e-6, (1, 0)),
+        TemporalProfile(0.8e-6, (1, 0)) + gaussian,
+    ]:
+        envelope = profile.evaluate_broadcast(xs, ys, ts)
+        assert envelope.shape == x.shape
+        assert np.allclose(envelope, profile.evaluate(x, y, t))
+
+
+class StripeTransverseProfile(TransverseProfile):
+    # Transverse profile that relies on x and y having the same shape
+    def __init__(self, a):
+        super().__init__()
+        self.a = a
+
+    def _evaluate(self, x, y):
+        envelope = np.zeros(x.shape)
+        envelope[np.abs(y) < self.a] = 1
+        return envelope
+
+
+class PositiveTimeCutGaussianProfile(GaussianProfile):
+    # Subclass whose evaluate relies on x, y, t having the same shape
+    def evaluate(self, x, y, t):
+        envelope = super().evaluate(x, y, t)
+        envelope[t > 0] = 0
+        return envelope
+
+
+@pytest.mark.parametrize("dim", ["xyt", "rt"])
+def test_custom_transverse_profile(gaussian, dim):
+    # Case with user-defined transverse profiles
+    wavelength = 0.8e-6
+    pol = (1, 0)
+    laser_energy = 1.0  # J
+    t_peak = 0.0e-15  # s
+    tau = 30.0e-15  # s
+    long_profile = GaussianLongitudinalProfile(wavelength, tau, t_peak)
+    stripe_profile = CombinedLongitudinalTransverseProfile(
+        wavelength, pol, laser_energy, long_profile, StripeTransverseProfile(5e-6)
+    )
+    dummy_profile = CombinedLongitudinalTransverseProfile(
+        wavelength, pol, laser_energy, long_profile, TransverseProfile()
+    )
+
+    if dim == "xyt":
+        lo = (-10e-6, -10e-6, -60e-15)
+        hi = (+10e-6, +10e-6, +60e-15)
+        npoints = (20, 30, 40)
+    else:
+        lo = (0e-6, -60e-15)
+        hi = (10e-6, +60e-15)
+        npoints = (20, 40)
+
+    cut_profile = PositiveTimeCutGaussianProfile(
+        wavelength, pol, laser_energy, 5e-6, tau, t_peak
+    )
+
+    for profile in [stripe_profile, dummy_profile + gaussian, cut_profile]:
+        laser = Laser(dim, lo, hi, npoints, profile, n_azimuthal_modes=2)
+        # Compare with the evaluation of the profile on the full grid
+        if dim == "xyt":
+            x, y, t = np.meshgrid(*laser.box.axes, indexing="ij")
+            envelope = laser.field.field
+        else:
+            theta1d = 2 * np.pi / 3 * np.arange(3)
+            theta, r, t = np.meshgrid(theta1d, *laser.box.axes, indexing="ij")
+            x = r * np.cos(theta)
+            y = r * np.sin(theta)
+            envelope = np.fft.fft(laser.field.field, axis=0)
+        assert np.allclose(envelope, profile.evaluate(x, y, t))
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+
+import numpy as np
+from scipy.constants import c, epsilon_0
+from lasy.laser import Laser
+from lasy.utils.laser_utils import (
+    compute_laser_energy,
+    compute_peak_field_amplitude,
+)
+
+
+def get_reference_energy(laser):
+    # Compute the energy with the direct expression of the volume integral
+    box = laser.box
+    envelope = laser.field.field.astype("complex128")
+    dz = box.dx[-1] * c
+    if laser.dim == "xyt":
+        dV = box.dx[0] * box.dx[1] * dz
+    else:
+        r = box.axes[0]
+        dr = box.dx[0]
+        dV = np.pi * ((r + 0.5 * dr) ** 2 - (r - 0.5 * dr) ** 2) * dz
+        dV = dV[np.newaxis, :, np.newaxis]
+    return (dV * epsilon_0 * 0.5 * abs(envelope) ** 2).sum()
+
+
+def get_analytic_energy(profile):
+    # Energy of a Gaussian pulse with a peak field amplitude of 1 V/m
+    w0 = profile.trans_profile.w0
+    tau = profile.long_profile.tau
+    return epsilon_0 / 2 * c * (np.pi * w0**2 / 2) * (np.sqrt(np.pi / 2) * tau)
+
+
+def check_laser_energy(laser, rtol):
+    energy = compute_laser_energy(laser.dim, laser.field)
+    assert np.isclose(energy, get_reference_energy(laser), rtol=rtol, atol=0)
+    assert np.isclose(energy, get_analytic_energy(laser.profile), rtol=1e-2, atol=0)
+
+
+@pytest.mark.parametrize("precision", ["double", "single"])
+def test_laser_energy_3d_cartesian(gaussian, precision):
+    # - 3D Cartesian case
+    dim = "xyt"
+    lo = (-20e-6, -20e-6, -60e-15)
+    hi = (+20e-6, +20e-6, +60e-15)
+    npoints = (50, 50, 50)
+    rtol = 1e-12 if precision == "double" else 1e-6
+
+    laser = Laser(dim, lo, hi, npoints, gaussian, precision=precision)
+    check_laser_energy(laser, rtol)
+    laser.propagate(1e-6)
+    check_laser_energy(laser, rtol)
+
+
+@pytest.mark.parametrize("precision", ["double", "single"])
+def test_laser_energy_cylindrical(gaussian, precision):
+    # - Cylindrical case
+    dim = "rt"
+    lo = (0e-6, -60e-15)
+    hi = (20e-6, +60e-15)
+    npoints = (50, 100)
+    rtol = 1e-12 if precision == "double" else 1e-6
+
+    laser = Laser(
+        dim, lo, hi, npoints, gaussian, n_azimuthal_modes=2, precision=precision
+    )
+    check_laser_energy(laser, rtol)
+    laser.propagate(1e-6)
+    check_laser_energy(laser, rtol)
+
+
+@pytest.mark.parametrize("precision", ["double", "single"])
+@pytest.mark.parametrize("dim", ["xyt", "rt"])
+def test_peak_normalization(gaussian, dim, precision):
+    if dim == "xyt":
+        lo = (-20e-6, -20e-6, -60e-15)
+        hi = (+20e-6, +20e-6, +60e-15)
+        npoints = (50, 50, 50)
+    else:
+        lo = (0e-6, -60e-15)
+        hi = (20e-6, +60e-15)
+        npoints = (50, 100)
+    rtol = 1e-12 if precision == "double" else 1e-6
+
+    laser = Laser(dim, lo, hi, npoints, gaussian, precision=precision)
+    peak_field_amplitude = np.abs(laser.field.field).max()
+    assert np.isclose(
+        compute_peak_field_amplitude(laser.field), peak_field_amplitude, rtol=rtol
+    )
+
+    # Normalize to a peak field amplitude
+    laser.normalize(2.0e12, kind="field")
+    assert np.isclose(np.abs(laser.field.field).max(), 2.0e12, rtol=rtol)
+    assert np.isclose(compute_peak_field_amplitude(laser.field), 2.0e12, rtol=rtol)
+
+    # Normalize to a peak intensity
+    laser.normalize(1.0e22, kind="intensity")
+    intensity = epsilon_0 * c / 2 * np.abs(laser.field.field) ** 2
+    assert np.isclose(intensity.max(), 1.0e22, rtol=rtol)
+
+    # By default, no scratch array is kept on the grid
+    assert laser.field._abs_scratch is None
+
+    # Check that the scratch array is reused when the grid opts in,
+    # and that it can be released
+    laser.field.keep_scratch = True
+    laser.normalize(1.0e12, kind="field")
+    scratch = laser.field._abs_scratch
+    assert scratch is not None
+    laser.normalize(3.0e12, kind="field")
+    assert laser.field._abs_scratch is scratch
+    assert np.isclose(np.abs(laser.field.field).max(), 3.0e12, rtol=rtol)
+    laser.field.release_scratch()
+    assert laser.field._abs_scratch is None